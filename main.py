@@ -1,19 +1,164 @@
+import atexit
+import bisect
+import difflib
+import functools
+import itertools
 import json
+import math
+import mmap
 import os
+import re
+import shutil
 import sys
+import tempfile
 
-from PyQt5.QtCore import Qt, QSettings, QTimer, QSize, QRegularExpression
+from PyQt5.QtCore import (
+    Qt, QSettings, QTimer, QSize, QPoint, QRegularExpression, QObject, QRunnable, QThread, QThreadPool,
+    QSignalBlocker, pyqtSignal, pyqtSlot
+)
 from PyQt5.QtGui import (
     QKeySequence, QColor, QTextCharFormat, QSyntaxHighlighter, QTextCursor, QFont, QPalette,
-    QTextDocument, QIcon, QPixmap, QTextFormat, QPainter
+    QIcon, QPixmap, QPixmapCache, QTextFormat, QPainter
 )
 from PyQt5.QtWidgets import (
     QApplication, QMainWindow, QAction, QFileDialog, QMessageBox, QTreeWidget, QTreeWidgetItem,
     QTabWidget, QWidget, QVBoxLayout, QTextEdit, QPushButton, QLabel, QLineEdit, QHBoxLayout,
     QToolBar, QStyleFactory, QShortcut, QStatusBar, QDockWidget,
-    QMenu, QToolButton, QTreeWidgetItemIterator, QPlainTextEdit
+    QMenu, QToolButton, QPlainTextEdit
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Above this many characters the editor skips syntax highlighting, and the tree
+# view is only rebuilt while it is the visible view.
+LARGE_DOCUMENT_CHARS = 1_000_000
+
+# Documents longer than this are parsed on the thread pool after an edit; shorter
+# ones parse in a few milliseconds, less than the cost of the hand-off.
+BACKGROUND_PARSE_CHARS = 200_000
+
+# Files larger than this are decoded straight from a memory map when opened.
+MMAP_THRESHOLD_BYTES = 8 << 20
+
+
+# orjson reads integers outside the signed 64-bit range as floats, silently dropping
+# digits. Such an integer can be as short as 19 digits (below -2**63), so text with
+# any run of 19 or more digits goes to the standard library, which keeps integers exact.
+_LONG_DIGIT_RUN_RE = re.compile(r'-?[0-9]{19,}')
+
+
+def load_json(text):
+    """
+    Parses JSON text, using orjson when it is installed and the standard
+    library otherwise. Both raise json.JSONDecodeError on invalid input,
+    including the NaN and Infinity constants the standard library would accept
+    and numbers too large for a float (such as 1e400), which it would read as inf.
+    """
+    if orjson is not None and not _LONG_DIGIT_RUN_RE.search(text):
+        return orjson.loads(text)
+
+    def reject_constant(name):
+        raise json.JSONDecodeError(f"{name} is not valid JSON", text, max(text.find(name), 0))
+
+    def parse_float(number):
+        value = float(number)
+        if math.isinf(value):
+            raise json.JSONDecodeError(f"{number} is out of range", text, max(text.find(number), 0))
+        return value
+
+    return json.loads(text, parse_constant=reject_constant, parse_float=parse_float)
+
+
+def dump_json(data, pretty=False):
+    """
+    Serializes data to JSON text, either compact or indented by 2 spaces
+    (the only indent orjson supports, so both backends produce the same output).
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0).decode("utf-8")
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits, which only the standard library parser produces.
+            pass
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+def read_text_file(path):
+    """
+    Returns the contents of a UTF-8 text file (the encoding JsonTab.save writes),
+    with universal newlines as open(path).read() would apply. Large files are
+    decoded from a read-only memory map instead of being copied into a bytes
+    buffer first, which roughly halves the peak memory needed to open them.
+    """
+    if os.path.getsize(path) <= MMAP_THRESHOLD_BYTES:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        has_carriage_returns = mapped.find(b'\r') != -1
+        with memoryview(mapped) as view:
+            text = str(view, 'utf-8')
+    if has_carriage_returns:
+        # Universal newlines, as text-mode open() would have applied.
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+_ASTRAL_CHAR_RE = re.compile('[\U00010000-\U0010FFFF]')
+
+
+def astral_char_offsets(text):
+    """
+    Returns the indices of the characters outside the BMP in text. Each of them
+    takes two UTF-16 code units in Qt but a single Python index.
+    """
+    if text.isascii():
+        return []
+    return [match.start() for match in _ASTRAL_CHAR_RE.finditer(text)]
+
+
+def to_qt_position(astral_offsets, index):
+    """Converts an index into a Python str to the UTF-16 position QTextCursor expects."""
+    return index + bisect.bisect_left(astral_offsets, index)
+
+
+def find_ranges(text, term):
+    """
+    Returns the (start, end) positions of every case-insensitive occurrence of term
+    in text, like QTextDocument.find with default flags but in a single regex pass.
+    Positions are in UTF-16 code units, as QTextCursor expects.
+    """
+    ranges = [match.span() for match in re.finditer(re.escape(term), text, re.IGNORECASE)]
+    astral = astral_char_offsets(text) if ranges else []
+    if astral:
+        ranges = [(to_qt_position(astral, start), to_qt_position(astral, end)) for start, end in ranges]
+    return ranges
+
+
+def existing_paths(paths):
+    """
+    Returns the paths that exist on disk, in their original order. Each parent
+    directory is listed once instead of stat()-ing every path separately; a
+    name that is not in the listing (a different case on a case-insensitive
+    file system, an unreadable directory) is still checked with os.path.exists.
+    """
+    entries_by_dir = {}
+    result = []
+    for path in paths:
+        directory = os.path.dirname(path)
+        if directory not in entries_by_dir:
+            try:
+                entries_by_dir[directory] = set(os.listdir(directory or os.curdir))
+            except OSError:
+                entries_by_dir[directory] = set()
+        if os.path.basename(path) in entries_by_dir[directory] or os.path.exists(path):
+            result.append(path)
+    return result
+
 
 class LineNumberArea(QWidget):
     """A helper widget that displays line numbers for the CodeEditor."""
@@ -40,9 +185,24 @@ class CodeEditor(QPlainTextEdit):
         self.updateRequest.connect(self.update_line_number_area)
         self.cursorPositionChanged.connect(self.highlight_current_line)
 
+        self._plain_text = (None, None)
+
         self.update_line_number_area_width(0)
         self.set_theme_colors("dark")  # Set a default theme
 
+    def plain_text(self):
+        """
+        Returns the editor's text like toPlainText(), but reuses the same string
+        until the document changes instead of copying the whole document each call.
+        The document revision is bumped by every edit, even with signals blocked.
+        """
+        revision = self.document().revision()
+        cached_revision, text = self._plain_text
+        if cached_revision != revision:
+            text = self.toPlainText()
+            self._plain_text = (revision, text)
+        return text
+
     def line_number_area_width(self):
         """Calculates the width needed for the line number area."""
         digits = 1
@@ -127,9 +287,21 @@ class JsonHighlighter(QSyntaxHighlighter):
     Supports light and dark themes.
     """
 
-    def __init__(self, parent=None):
+    # A single alternation scans each block once. Strings come before keywords
+    # and numbers so that their contents are never highlighted as such.
+    _token_patterns = [
+        (r'"[^"\\]*(?:\\.[^"\\]*)*"(?=\s*:)', "string_key"),
+        (r'"[^"\\]*(?:\\.[^"\\]*)*"', "string_value"),
+        (r'\b(?:true|false|null)\b', "keyword"),
+        (r'\b-?(?:[0-9]|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?\b', "number"),
+    ]
+    # Compiled and JIT-optimized once at import, and shared by every tab's highlighter.
+    _token_expression = QRegularExpression("|".join(f"({pattern})" for pattern, _ in _token_patterns))
+    _token_expression.optimize()
+    _token_kinds = [fmt_key for _, fmt_key in _token_patterns]
+
+    def __init__(self, parent=None, theme="light"):
         super().__init__(parent)
-        self._rules_compiled = []
 
         self.dark_theme_colors = {
             "keyword": QColor("#569cd6"),
@@ -143,52 +315,132 @@ class JsonHighlighter(QSyntaxHighlighter):
             "string": QColor("#008000"),
             "string_key": QColor("#000080"),
         }
+        self._formats_by_theme = {
+            "dark": self._build_formats(self.dark_theme_colors),
+            "light": self._build_formats(self.light_theme_colors),
+        }
         self.formats = {}
-
-        patterns = [
-            (r'"[^"\\]*(?:\\.[^"\\]*)*"(?=\s*:)', "string_key"),
-            (r'\b(true|false|null)\b', "keyword"),
-            (r'\b-?(?:[0-9]|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?\b', "number"),
-            (r'"[^"\\]*(?:\\.[^"\\]*)*"', "string_value")
-        ]
-
-        for pattern, fmt_key in patterns:
-            self._rules_compiled.append((QRegularExpression(pattern), fmt_key))
-        self.set_theme("light")
+        self.theme = None
+        self._large = self._is_large()
+        self.document().contentsChange.connect(self._on_contents_change)
+        # Highlights the document right away, which also cancels the deferred pass
+        # QSyntaxHighlighter would otherwise run (and report as a text change).
+        self.set_theme(theme)
+
+    @staticmethod
+    def _build_formats(colors):
+        """Builds the QTextCharFormat for each token type from a theme's colors."""
+        formats = {
+            "keyword": QTextCharFormat(),
+            "number": QTextCharFormat(),
+            "string_key": QTextCharFormat(),
+            "string_value": QTextCharFormat(),
+        }
+        formats["keyword"].setForeground(colors["keyword"])
+        formats["keyword"].setFontWeight(QFont.Bold)
+        formats["number"].setForeground(colors["number"])
+        formats["string_key"].setForeground(colors["string_key"])
+        formats["string_value"].setForeground(colors["string"])
+        return formats
 
     def set_theme(self, mode):
         """
-        Sets the color theme for the highlighter and rehighlights the document.
+        Sets the color theme for the highlighter and rehighlights the document,
+        unless the theme is already in use. The formats for both themes are built
+        once in __init__.
         """
-        colors = self.dark_theme_colors if mode == "dark" else self.light_theme_colors
-
-        self.formats["keyword"] = QTextCharFormat()
-        self.formats["keyword"].setForeground(colors["keyword"])
-        self.formats["keyword"].setFontWeight(QFont.Bold)
-
-        self.formats["number"] = QTextCharFormat()
-        self.formats["number"].setForeground(colors["number"])
-
-        self.formats["string_key"] = QTextCharFormat()
-        self.formats["string_key"].setForeground(colors["string_key"])
+        mode = "dark" if mode == "dark" else "light"
+        if mode == self.theme:
+            return
+        self.theme = mode
+        self.formats = self._formats_by_theme[mode]
+        self.rehighlight()
 
-        self.formats["string_value"] = QTextCharFormat()
-        self.formats["string_value"].setForeground(colors["string"])
+    def _is_large(self):
+        """Whether the document is too large to be highlighted."""
+        return self.document().characterCount() > LARGE_DOCUMENT_CHARS
 
-        self.rehighlight()
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        """
+        Rehighlights the whole document once when it grows past, or shrinks back
+        below, LARGE_DOCUMENT_CHARS; otherwise only the edited blocks would change.
+        """
+        large = self._is_large()
+        if large != self._large:
+            self._large = large
+            # An edit that replaced the whole document has just been highlighted in full.
+            if position > 0 or chars_added < self.document().characterCount() - 1:
+                self.rehighlight()
 
     def highlightBlock(self, text):
         """
         Applies highlighting to a single block of text.
-        Uses pre-compiled QRegularExpression for better performance.
+        Uses one pre-compiled QRegularExpression and dispatches on the group that matched.
+        Large documents are left uncolored to keep editing responsive.
         """
-        for expression, fmt_key in self._rules_compiled:
-            iterator = expression.globalMatch(text)
-            while iterator.hasNext():
-                match = iterator.next()
-                start = match.capturedStart()
-                length = match.capturedLength()
-                self.setFormat(start, length, self.formats.get(fmt_key))
+        # Checked per block rather than via _large, which is only updated after
+        # QSyntaxHighlighter has highlighted the blocks of the edit that crossed the limit.
+        if self._is_large():
+            return
+
+        iterator = self._token_expression.globalMatch(text)
+        while iterator.hasNext():
+            match = iterator.next()
+            for group, fmt_key in enumerate(self._token_kinds, 1):
+                if match.capturedStart(group) != -1:
+                    self.setFormat(match.capturedStart(), match.capturedLength(), self.formats[fmt_key])
+                    break
+
+
+class JsonParseSignals(QObject):
+    """Signals emitted by a JsonParseJob: (sequence number, text, data, error)."""
+    finished = pyqtSignal(int, object, object, object)
+
+
+class JsonParseJob(QRunnable):
+    """
+    Parses JSON text on a QThreadPool worker thread. Only plain Python data is
+    produced here; tree items are created on the UI thread when the result arrives.
+    """
+
+    def __init__(self, seq, text):
+        super().__init__()
+        self.seq = seq
+        self.text = text
+        self.signals = JsonParseSignals()
+
+    def run(self):
+        try:
+            data = load_json(self.text)
+        except json.JSONDecodeError as e:
+            self.signals.finished.emit(self.seq, self.text, None, e)
+        else:
+            self.signals.finished.emit(self.seq, self.text, data, None)
+
+
+class FileReadSignals(QObject):
+    """Signals emitted by a FileReadJob: (filename, content, error)."""
+    finished = pyqtSignal(str, object, object)
+
+
+class FileReadJob(QRunnable):
+    """
+    Reads a file on a QThreadPool worker thread, so that restoring a session
+    does not wait on the disk one file at a time.
+    """
+
+    def __init__(self, filename):
+        super().__init__()
+        self.filename = filename
+        self.signals = FileReadSignals()
+
+    def run(self):
+        try:
+            content = read_text_file(self.filename)
+        except Exception as e:
+            self.signals.finished.emit(self.filename, None, e)
+        else:
+            self.signals.finished.emit(self.filename, content, None)
 
 
 class JsonTab(QWidget):
@@ -196,14 +448,26 @@ class JsonTab(QWidget):
     Represents a single tab in the JSON editor, containing an editor
     and a tree view.
     """
+    # Emitted with the previous filename whenever the tab is saved under a new name.
+    filename_changed = pyqtSignal(object)
 
-    def __init__(self, filename=None, content=""):
+    def __init__(self, filename=None, content="", tab_widget=None, theme="light"):
         super().__init__()
+        self.tab_widget = tab_widget
         self.filename = filename
         self.modified = False
         self.is_valid = True
         self.json_data = None
         self._last_json_error = None
+        self._parse_cache = (None, None)
+        # pretty -> (document revision, formatted text, or None when the editor
+        # text is already in that form).
+        self._format_cache = {}
+        self._parse_seq = 0
+        self._subtrees = []
+        self._tree_stale = False
+        # Set by the main window to follow its native file dialogs setting.
+        self.dialog_options = QFileDialog.Options()
 
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(0, 0, 0, 0)
@@ -218,23 +482,24 @@ class JsonTab(QWidget):
 
         self.editor.setFont(QFont("Consolas", 10))
         self.editor.setTabStopWidth(4 * self.editor.fontMetrics().width(' '))
-        self.highlighter = JsonHighlighter(self.editor.document())
+        self.highlighter = JsonHighlighter(self.editor.document(), theme)
 
         self.update_timer = QTimer(self)
         self.update_timer.setSingleShot(True)
-        self.update_timer.setInterval(300)
-        self.editor.textChanged.connect(self.update_timer.start)
-        self.update_timer.timeout.connect(self.update_views)
+        self.update_timer.setInterval(500)
+        self.update_timer.timeout.connect(self.parse_in_background)
 
-        self.editor.textChanged.connect(self.mark_modified)
+        self.editor.textChanged.connect(self._on_text_changed)
         self.main_tab_widget.addTab(self.editor, "Editor")
 
         self.tree_widget = QTreeWidget()
         self.tree_widget.setHeaderLabels(["Key", "Value"])
         self.tree_widget.itemDoubleClicked.connect(self.navigate_to_key)
+        self.tree_widget.itemExpanded.connect(self._expand_item)
         self.tree_widget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.tree_widget.customContextMenuRequested.connect(self.show_context_menu)
         self.main_tab_widget.addTab(self.tree_widget, "Tree View")
+        self.main_tab_widget.currentChanged.connect(self._on_view_changed)
 
         self.layout.addWidget(self.main_tab_widget)
 
@@ -295,54 +560,230 @@ class JsonTab(QWidget):
 
     def update_views(self):
         """
-        Parses the JSON in the editor and updates the Tree View.
-        Handles invalid JSON by displaying an error in the tree view, which is expected behavior
-        when non-JSON text is pasted or typed. This method is now debounced.
+        Parses the JSON in the editor immediately and updates the Tree View.
+        Used where the validation status is needed right away; edits are parsed
+        in the background by parse_in_background instead.
         """
-        self.is_valid = True
-        self._last_json_error = None
+        self._parse_seq += 1
         try:
-            self.json_data = json.loads(self.editor.toPlainText())
-            self.build_tree(self.tree_widget, self.json_data)
+            data = self._parsed()
         except json.JSONDecodeError as e:
+            self._show_parse_result(None, e)
+        else:
+            self._show_parse_result(data, None)
+
+    def parse_in_background(self):
+        """
+        Parses the JSON in the editor after an edit. Triggered by the debounce timer.
+        Large documents are parsed on the global thread pool, which keeps Qt's
+        event loop (and its C++ painting and input handling) running. Both parsers
+        hold the GIL for the whole parse, though, so Python code on the UI thread,
+        such as highlightBlock and the line number painting, still waits for it.
+        """
+        text = self.editor.plain_text()
+        if len(text) <= BACKGROUND_PARSE_CHARS or text == self._parse_cache[0]:
+            self.update_views()
+            return
+        self._parse_seq += 1
+        job = JsonParseJob(self._parse_seq, text)
+        job.signals.finished.connect(self._on_parse_finished)
+        QThreadPool.globalInstance().start(job)
+
+    def _on_parse_finished(self, seq, text, data, error):
+        """Applies the result of a background parse unless a newer parse has started since."""
+        if seq != self._parse_seq:
+            return
+        if error is None:
+            self._parse_cache = (text, data)
+        self._show_parse_result(data, error)
+
+    def _show_parse_result(self, data, error):
+        """
+        Stores the parse result and updates the Tree View.
+        Handles invalid JSON by displaying an error in the tree view, which is expected behavior
+        when non-JSON text is pasted or typed.
+        """
+        if error is None:
+            self.is_valid = True
+            self._last_json_error = None
+            self.json_data = data
+            if (self.editor.document().characterCount() > LARGE_DOCUMENT_CHARS
+                    and self.main_tab_widget.currentWidget() is not self.tree_widget):
+                self.tree_widget.clear()
+                self._subtrees = []
+                self._tree_stale = True
+            else:
+                self.refresh_tree(self.json_data)
+        else:
             self.is_valid = False
             self.json_data = None
-            self._last_json_error = e
+            self._last_json_error = error
             self.tree_widget.clear()
+            self._subtrees = []
             error_item = QTreeWidgetItem(self.tree_widget)
             error_item.setText(0, "Invalid JSON")
-            error_item.setText(1, str(e))
+            error_item.setText(1, str(error))
             self.tree_widget.addTopLevelItem(error_item)
 
+    def _parsed(self):
+        """
+        Returns the parsed editor text, reusing the previous result while the text
+        is unchanged. Raises json.JSONDecodeError if the text is not valid JSON.
+        """
+        text = self.editor.plain_text()
+        cached_text, cached_data = self._parse_cache
+        if text == cached_text:
+            return cached_data
+        data = load_json(text)
+        self._parse_cache = (text, data)
+        return data
+
+    def refresh_tree(self, data):
+        """
+        Shows data in the Tree View. While the document keeps its shape (same keys,
+        array lengths and value kinds at every built level) the existing items are
+        updated in place, which avoids recreating them and keeps expanded items open.
+        """
+        if self._sync_tree_level(self.tree_widget.invisibleRootItem(), data):
+            self._tree_stale = False
+        else:
+            self.build_tree(self.tree_widget, data)
+
     def build_tree(self, parent_widget, data):
         """
-        Clears the tree widget and builds it recursively from the JSON data.
+        Clears the tree widget and builds its top level from the JSON data.
+        Deeper levels are built on demand when their parent item is expanded.
         """
+        parent_widget.setUpdatesEnabled(False)
         parent_widget.clear()
-        self._build_tree_recursive(parent_widget, data)
+        self._subtrees = []
+        self._tree_stale = False
+        self._build_tree_level(parent_widget.invisibleRootItem(), data)
+        parent_widget.setUpdatesEnabled(True)
+
+    def _on_view_changed(self, index):
+        """Builds the tree if it was skipped for a large document and the Tree View is now shown."""
+        if self._tree_stale and self.main_tab_widget.widget(index) is self.tree_widget:
+            self.refresh_tree(self.json_data)
+
+    @staticmethod
+    def _tree_entries(data):
+        """Returns the (label, value) pairs shown as children of a JSON object or array."""
+        if isinstance(data, dict):
+            return [(str(key), value) for key, value in data.items()]
+        if isinstance(data, list):
+            return [(f"[{i}]", value) for i, value in enumerate(data)]
+        return []
 
-    def _build_tree_recursive(self, parent_item, data):
+    def _build_tree_level(self, parent_item, data):
         """
-        Helper function to recursively build the QTreeWidget items.
-        Stores the full path of each item for navigation.
+        Creates the direct children of parent_item for a JSON object or array.
+        Non-empty containers get a placeholder child so they can be expanded;
+        their data is kept in _subtrees (indexed by the item's UserRole + 1 data)
+        until _expand_item builds them.
         """
-        if isinstance(data, dict):
-            for key, value in data.items():
-                item = QTreeWidgetItem(parent_item)
-                item.setText(0, str(key))
-                item.setText(1, str(type(value).__name__))
-                item.setData(1, Qt.UserRole, value if not isinstance(value, (dict, list)) else None)
-                self._build_tree_recursive(item, value)
-        elif isinstance(data, list):
-            for i, value in enumerate(data):
-                item = QTreeWidgetItem(parent_item)
-                item.setText(0, f"[{i}]")
-                item.setText(1, str(type(value).__name__))
-                item.setData(1, Qt.UserRole, value if not isinstance(value, (dict, list)) else None)
-                self._build_tree_recursive(item, value)
-        else:
-            parent_item.setText(1, str(data))
-            parent_item.setData(1, Qt.UserRole, data)
+        items = []
+        for key, value in self._tree_entries(data):
+            if isinstance(value, (dict, list)):
+                item = QTreeWidgetItem([key, type(value).__name__])
+                item.setData(0, Qt.UserRole, type(value).__name__)
+                if value:
+                    item.setData(0, Qt.UserRole + 1, len(self._subtrees))
+                    self._subtrees.append(value)
+                    QTreeWidgetItem(item)
+            else:
+                item = QTreeWidgetItem([key, str(value)])
+                item.setData(1, Qt.UserRole, value)
+            items.append(item)
+        # Items are attached in one call so the model is only notified once per level.
+        parent_item.addChildren(items)
+
+    def _sync_tree_level(self, parent_item, data):
+        """
+        Updates the existing children of parent_item in place from data, recursing
+        into containers that have been expanded. Returns False as soon as a key or
+        the kind of a value (object, array or scalar) no longer matches.
+        """
+        entries = self._tree_entries(data)
+        if parent_item.childCount() != len(entries):
+            return False
+
+        for i, (key, value) in enumerate(entries):
+            item = parent_item.child(i)
+            kind = type(value).__name__ if isinstance(value, (dict, list)) else None
+            if item.text(0) != key or item.data(0, Qt.UserRole) != kind:
+                return False
+
+            if kind is None:
+                item.setText(1, str(value))
+                item.setData(1, Qt.UserRole, value)
+                continue
+
+            index = item.data(0, Qt.UserRole + 1)
+            if index is not None and self._subtrees[index] is not None:
+                # Not expanded yet: swap the data behind the placeholder.
+                if value:
+                    self._subtrees[index] = value
+                else:
+                    self._subtrees[index] = None
+                    item.takeChildren()
+            elif not self._sync_tree_level(item, value):
+                return False
+        return True
+
+    def _expand_item(self, item: QTreeWidgetItem):
+        """Replaces the placeholder of an item with its real children on first expansion."""
+        index = item.data(0, Qt.UserRole + 1)
+        if index is None or self._subtrees[index] is None:
+            return
+        data, self._subtrees[index] = self._subtrees[index], None
+        item.takeChildren()
+        self._build_tree_level(item, data)
+
+    def _item_path(self, item: QTreeWidgetItem):
+        """Returns the child indices leading from the top level of the tree to item."""
+        path = []
+        while item is not None:
+            parent = item.parent()
+            if parent is None:
+                path.append(self.tree_widget.indexOfTopLevelItem(item))
+            else:
+                path.append(parent.indexOfChild(item))
+            item = parent
+        path.reverse()
+        return path
+
+    def _key_occurrences_before(self, path, key_text):
+        """
+        Counts how often key_text appears as an object key before the node at path,
+        in document order. Works on the parsed data because the tree may be partially built.
+        """
+        def count_in(data):
+            count = 0
+            stack = [data]
+            while stack:
+                node = stack.pop()
+                if isinstance(node, dict):
+                    count += key_text in node
+                    stack.extend(node.values())
+                elif isinstance(node, list):
+                    stack.extend(node)
+            return count
+
+        count = 0
+        node = self.json_data
+        for depth, index in enumerate(path):
+            if isinstance(node, dict):
+                keys = list(node)
+                # Ancestors precede their descendants, so their own key counts too.
+                count += keys[:index if depth == len(path) - 1 else index + 1].count(key_text)
+                children = list(node.values())
+            else:
+                children = node
+            for value in children[:index]:
+                count += count_in(value)
+            node = children[index]
+        return count
 
     def navigate_to_key(self, item: QTreeWidgetItem, column: int):
         """
@@ -351,18 +792,10 @@ class JsonTab(QWidget):
         name is not unique.
         """
         key_text = item.text(0)
-        if key_text.startswith('['):
+        if key_text.startswith('[') or self.json_data is None:
             return
 
-        occurrence_index = 0
-        it = QTreeWidgetItemIterator(self.tree_widget)
-        while it.value():
-            current_item = it.value()
-            if current_item is item:
-                break
-            if current_item.text(0) == key_text:
-                occurrence_index += 1
-            it += 1
+        occurrence_index = self._key_occurrences_before(self._item_path(item), key_text)
         search_term = f'"{key_text}"'
         editor = self.editor
         self.main_tab_widget.setCurrentWidget(editor)
@@ -400,6 +833,36 @@ class JsonTab(QWidget):
 
         menu.exec_(self.tree_widget.mapToGlobal(position))
 
+    def _on_text_changed(self):
+        """
+        Single slot for the editor's textChanged signal. Restarts the debounce
+        timer and only marks the tab modified on the first change.
+        """
+        self.update_timer.start()
+        if not self.modified:
+            self.mark_modified()
+
+    @property
+    def filename(self):
+        """The path of the file shown in this tab, or None for an unsaved tab."""
+        return self._filename
+
+    @filename.setter
+    def filename(self, value):
+        previous = getattr(self, '_filename', None)
+        self._filename = value
+        # Kept alongside the path for titles, prompts and status messages.
+        self.basename = os.path.basename(value) if value else "Untitled"
+        if value != previous:
+            self.filename_changed.emit(previous)
+
+    def _refresh_title(self):
+        """Sets the tab title to the file name, followed by an asterisk if there are unsaved changes."""
+        if self.tab_widget is None:
+            return
+        title = self.basename
+        self.tab_widget.setTabText(self.tab_widget.indexOf(self), title + " *" if self.modified else title)
+
     def mark_modified(self):
         """
         Marks the tab as modified and updates its title with an asterisk.
@@ -409,28 +872,77 @@ class JsonTab(QWidget):
         """
         if not self.modified:
             self.modified = True
-            tab_widget = self.parent().parent()
-            tab_widget.setTabText(tab_widget.indexOf(self),
-                                  os.path.basename(self.filename) + " *" if self.filename else "Untitled *")
+            self._refresh_title()
+
+    def _formatted(self, pretty):
+        """
+        Returns the editor text pretty printed or minified. Results are remembered
+        for the current document revision only, so clicking Format or Minify again
+        on unchanged text does not reserialize, and no old copies of the text are kept.
+        """
+        revision = self.editor.document().revision()
+        cached_revision, formatted_text = self._format_cache.get(pretty, (None, None))
+        if cached_revision == revision:
+            return self.editor.plain_text() if formatted_text is None else formatted_text
+
+        data = self._parsed()
+        formatted_text = dump_json(data, pretty=pretty)
+        self._format_cache = {pretty: (revision, formatted_text)}
+        return formatted_text
+
+    def _remember_formatted(self, pretty, text, data):
+        """Records that the editor now holds text, the formatted form of data."""
+        self._format_cache = {pretty: (self.editor.document().revision(), None)}
+        self._parse_cache = (text, data)
+
+    def _replace_text(self, new_text):
+        """
+        Replaces the editor text without reporting it as a user edit. When the
+        old and new text are of similar length, only the lines that differ are
+        rewritten, in one undoable step, so layout and highlighting are redone
+        for the changed lines only. Otherwise the whole document is replaced.
+        """
+        old_text = self.editor.plain_text()
+        opcodes = None
+        if abs(len(new_text) - len(old_text)) < 0.2 * max(len(old_text), 1):
+            old_lines = old_text.splitlines(keepends=True)
+            new_lines = new_text.splitlines(keepends=True)
+            opcodes = difflib.SequenceMatcher(None, old_lines, new_lines).get_opcodes()
+            unchanged = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag == 'equal')
+            if unchanged < len(old_lines) // 2:
+                # Mostly rewritten: one replacement is cheaper than many small edits.
+                opcodes = None
+        self.editor.blockSignals(True)
+        if opcodes is not None:
+            line_starts = list(itertools.accumulate(map(len, old_lines), initial=0))
+            astral = astral_char_offsets(old_text)
+            cursor = QTextCursor(self.editor.document())
+            cursor.beginEditBlock()
+            # Back to front, so the positions of the edits still to come stay valid.
+            for tag, i1, i2, j1, j2 in reversed(opcodes):
+                if tag != 'equal':
+                    cursor.setPosition(to_qt_position(astral, line_starts[i1]))
+                    cursor.setPosition(to_qt_position(astral, line_starts[i2]), QTextCursor.KeepAnchor)
+                    cursor.insertText("".join(new_lines[j1:j2]))
+            cursor.endEditBlock()
+        else:
+            self.editor.setPlainText(new_text)
+        self.editor.blockSignals(False)
 
     def pretty_print(self):
         """
-        Formats the JSON content in the editor with an indent of 4 spaces.
+        Formats the JSON content in the editor with an indent of 2 spaces.
         """
         try:
-            if not self.json_data:
-                self.json_data = json.loads(self.editor.toPlainText())
-
-            formatted_text = json.dumps(self.json_data, indent=4)
+            formatted_text = self._formatted(pretty=True)
 
-            if self.editor.toPlainText() != formatted_text:
-                self.editor.blockSignals(True)
-                self.editor.setPlainText(formatted_text)
-                self.editor.blockSignals(False)
+            if self.editor.plain_text() != formatted_text:
+                data = self._parsed()
+                self._replace_text(formatted_text)
+                # Formatting is idempotent, and the output is now the editor text.
+                self._remember_formatted(True, formatted_text, data)
                 self.modified = True
-                tab_widget = self.parent().parent()
-                tab_widget.setTabText(tab_widget.indexOf(self),
-                                      os.path.basename(self.filename) + " *" if self.filename else "Untitled *")
+                self._refresh_title()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Invalid JSON: {e}")
 
@@ -439,19 +951,15 @@ class JsonTab(QWidget):
         Minifies the JSON content in the editor (removes whitespace).
         """
         try:
-            if not self.json_data:
-                self.json_data = json.loads(self.editor.toPlainText())
+            minified_text = self._formatted(pretty=False)
 
-            minified_text = json.dumps(self.json_data, separators=(',', ':'))
-
-            if self.editor.toPlainText() != minified_text:
-                self.editor.blockSignals(True)
-                self.editor.setPlainText(minified_text)
-                self.editor.blockSignals(False)
+            if self.editor.plain_text() != minified_text:
+                data = self._parsed()
+                self._replace_text(minified_text)
+                # Formatting is idempotent, and the output is now the editor text.
+                self._remember_formatted(False, minified_text, data)
                 self.modified = True
-                tab_widget = self.parent().parent()
-                tab_widget.setTabText(tab_widget.indexOf(self),
-                                      os.path.basename(self.filename) + " *" if self.filename else "Untitled *")
+                self._refresh_title()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Invalid JSON: {e}")
 
@@ -492,22 +1000,66 @@ class JsonTab(QWidget):
 
         if not self.filename:
             return self.save_as()
+        error = self.save_without_prompts()
+        if error is not None:
+            QMessageBox.critical(self, "Error", error)
+            return False
+        return True
+
+    def save_without_prompts(self):
+        """
+        Writes the editor text to the tab's file, valid JSON or not, without showing
+        any dialog. Returns None on success, or a message saying why it failed.
+        """
+        if not self.filename:
+            return "The file has never been saved."
         try:
-            with open(self.filename, 'w') as f:
-                f.write(self.editor.toPlainText())
-            self.modified = False
-            tab_widget = self.parent().parent()
-            tab_widget.setTabText(tab_widget.indexOf(self), os.path.basename(self.filename))
-            return True
+            self._write_file_atomically(self.editor.plain_text().encode("utf-8"))
         except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-            return False
+            return str(e)
+        self.modified = False
+        self._refresh_title()
+        return None
+
+    def _write_file_atomically(self, data):
+        """
+        Writes data to a temporary file next to the target and then moves it into
+        place, so an interrupted save never leaves a truncated file behind.
+        """
+        target = os.path.realpath(self.filename)
+        directory, name = os.path.split(target)
+        # A unique name, so that no file of the user's is overwritten or removed.
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            if os.path.exists(target):
+                shutil.copymode(target, temp_path)
+            else:
+                # mkstemp creates the file readable by its owner only; a new file
+                # gets the permissions open() would have given it.
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def ask_filename(self):
+        """Asks the user for a filename to save to. Returns "" if they cancelled."""
+        filename, _ = QFileDialog.getSaveFileName(self, "Save JSON", "", "JSON Files (*.json)",
+                                                  options=self.dialog_options)
+        return filename
 
     def save_as(self):
         """
         Prompts the user to choose a new filename and saves the content.
         """
-        filename, _ = QFileDialog.getSaveFileName(self, "Save JSON", "", "JSON Files (*.json)")
+        filename = self.ask_filename()
         if filename:
             self.filename = filename
             return self.save()
@@ -515,25 +1067,22 @@ class JsonTab(QWidget):
 
     def show_json_error(self, error: json.JSONDecodeError):
         """
-        Navigates to the line and column of a JSONDecodeError and highlights it.
+        Navigates to the position of a JSONDecodeError and highlights it.
+        The error already holds the absolute offset into the parsed text, so no
+        line lookup is needed.
         """
         editor = self.editor
         self.main_tab_widget.setCurrentIndex(0)
 
         editor.setExtraSelections([])
 
-        if error.lineno is None or error.colno is None:
+        if error.pos is None or error.doc is None:
             QMessageBox.warning(self, "Error Location", f"Could not determine specific error location for: {error.msg}")
             return
 
+        position = to_qt_position(astral_char_offsets(error.doc), min(error.pos, len(error.doc)))
         cursor = QTextCursor(editor.document())
-
-        block = editor.document().findBlockByLineNumber(error.lineno - 1)
-        if not block.isValid():
-            QMessageBox.warning(self, "Error Location", f"Could not find line {error.lineno}.")
-            return
-
-        cursor.setPosition(block.position() + error.colno - 1)
+        cursor.setPosition(min(position, editor.document().characterCount() - 1))
 
         cursor.movePosition(QTextCursor.NextCharacter, QTextCursor.KeepAnchor, 1)
 
@@ -607,8 +1156,20 @@ class SearchPanel(QDockWidget):
         self.current_match_format = QTextCharFormat()
         self.set_highlight_colors("dark")
 
+        # Only matches inside the viewport are highlighted, so refresh after scrolling.
+        self._highlight_refresh_timer = QTimer(self)
+        self._highlight_refresh_timer.setSingleShot(True)
+        self._highlight_refresh_timer.setInterval(50)
+        self._highlight_refresh_timer.timeout.connect(self.update_match_highlights)
+
+        # Searching runs once typing in the search box pauses, not on every keystroke.
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(lambda: self.find_all_matches(self.search_box.text()))
+        self._match_cache = (None, None, None, [])
+
         self.parent().tabs.currentChanged.connect(self.on_tab_changed)
-        self.search_box.textChanged.connect(self.on_search_box_changed)
 
         self.escape_shortcut = QShortcut(QKeySequence(Qt.Key_Escape), self)
         self.escape_shortcut.activated.connect(self.hide_and_clear)
@@ -634,8 +1195,27 @@ class SearchPanel(QDockWidget):
             self.find_all_matches(self.search_box.text())
 
     def on_search_box_changed(self):
-        """Triggered when search box text changes, re-finds all matches."""
-        self.find_all_matches(self.search_box.text())
+        """Triggered when search box text changes, re-finds all matches after a short delay."""
+        self._search_timer.start()
+
+    def _flush_pending_search(self):
+        """Runs a search that is still waiting for the debounce delay, e.g. when Enter is pressed."""
+        if self._search_timer.isActive():
+            self._search_timer.stop()
+            self.find_all_matches(self.search_box.text())
+
+    def _match_ranges(self, editor, text):
+        """
+        Returns the match ranges of text in the editor, reusing the previous result
+        while the document and its revision (bumped by every edit) are unchanged.
+        """
+        document = editor.document()
+        revision = document.revision()
+        cached_document, cached_revision, cached_text, ranges = self._match_cache
+        if cached_document is not document or cached_revision != revision or cached_text != text:
+            ranges = find_ranges(editor.plain_text(), text)
+            self._match_cache = (document, revision, text, ranges)
+        return ranges
 
     def get_current_editor(self):
         """Helper to get the QTextEdit of the currently active tab."""
@@ -651,16 +1231,45 @@ class SearchPanel(QDockWidget):
             return
         editor.setExtraSelections([])
 
+    def schedule_highlight_refresh(self):
+        """Refreshes the match highlights shortly after the editor scrolls."""
+        if self.matches:
+            self._highlight_refresh_timer.start()
+
     def update_match_highlights(self):
-        """Applies highlights to all found matches and highlights the current match using setExtraSelections."""
+        """
+        Highlights the found matches that are inside the editor's viewport, and the
+        current match, using setExtraSelections. Matches are sorted by position, so
+        the first visible one is found by binary search.
+        """
         editor = self.get_current_editor()
         if not editor:
             return
 
+        viewport = editor.viewport()
+        first = editor.cursorForPosition(QPoint(0, 0)).position()
+        last = editor.cursorForPosition(QPoint(viewport.width(), viewport.height())).position()
+
+        low, high = 0, len(self.matches)
+        while low < high:
+            middle = (low + high) // 2
+            if self.matches[middle].selectionEnd() < first:
+                low = middle + 1
+            else:
+                high = middle
+
+        visible = []
+        index = low
+        while index < len(self.matches) and self.matches[index].selectionStart() <= last:
+            visible.append(index)
+            index += 1
+        if 0 <= self.current_match_index < len(self.matches) and self.current_match_index not in visible:
+            visible.append(self.current_match_index)
+
         extra_selections = []
-        for i, match_cursor_template in enumerate(self.matches):
+        for i in visible:
             selection = QTextEdit.ExtraSelection()
-            selection.cursor = match_cursor_template
+            selection.cursor = self.matches[i]
 
             if i == self.current_match_index:
                 selection.format = self.current_match_format
@@ -681,12 +1290,11 @@ class SearchPanel(QDockWidget):
             return
 
         document = editor.document()
-        cursor = QTextCursor(document)
-        while True:
-            cursor = document.find(text, cursor, QTextDocument.FindFlags())
-            if cursor.isNull():
-                break
-            self.matches.append(QTextCursor(cursor))
+        for start, end in self._match_ranges(editor, text):
+            cursor = QTextCursor(document)
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            self.matches.append(cursor)
 
         if not self.matches:
             self.match_count_label.setText("No matches")
@@ -694,13 +1302,14 @@ class SearchPanel(QDockWidget):
             self.clear_highlights()
         else:
             self.current_match_index = 0
-            self.update_match_highlights()
             self.match_count_label.setText(f"{self.current_match_index + 1} of {len(self.matches)}")
             editor.setTextCursor(self.matches[self.current_match_index])
             editor.ensureCursorVisible()
+            self.update_match_highlights()
 
     def find_next(self):
         """Finds the next occurrence of the search term."""
+        self._flush_pending_search()
         editor = self.get_current_editor()
         text = self.search_box.text()
 
@@ -720,6 +1329,7 @@ class SearchPanel(QDockWidget):
 
     def find_prev(self):
         """Finds the previous occurrence of the search term."""
+        self._flush_pending_search()
         editor = self.get_current_editor()
         text = self.search_box.text()
 
@@ -739,6 +1349,7 @@ class SearchPanel(QDockWidget):
 
     def replace_current(self):
         """Replaces the currently highlighted match."""
+        self._flush_pending_search()
         editor = self.get_current_editor()
         if not editor or not self.matches or self.current_match_index == -1:
             return
@@ -758,16 +1369,14 @@ class SearchPanel(QDockWidget):
         self.find_all_matches(self.search_box.text())
         current_tab = self.parent().tabs.currentWidget()
         if current_tab:
-            current_tab.modified = True
-            tab_widget = current_tab.parent().parent()
-            tab_widget.setTabText(tab_widget.indexOf(current_tab),
-                                  os.path.basename(
-                                      current_tab.filename) + " *" if current_tab.filename else "Untitled *")
+            current_tab.mark_modified()
+            current_tab.update_timer.start()
 
     def replace_all(self):
         """
         Replaces all occurrences of the search term efficiently and safely.
-        This version avoids creating temporary widgets and uses a single undo block.
+        The new text is built in one pass and inserted as a single edit, so the
+        document is laid out and highlighted once and undo is a single step.
         """
         editor = self.get_current_editor()
         search_text = self.search_box.text()
@@ -776,34 +1385,28 @@ class SearchPanel(QDockWidget):
         if not editor or not search_text:
             return
 
-        document = editor.document()
-        locations = []
-        find_cursor = QTextCursor(document)
-        while True:
-            find_cursor = document.find(search_text, find_cursor, QTextDocument.FindFlags())
-            if find_cursor.isNull():
-                break
-            locations.append((find_cursor.selectionStart(), find_cursor.selectionEnd()))
-
-        if not locations:
+        new_text, count = re.subn(re.escape(search_text), lambda _: replace_text, editor.plain_text(),
+                                  flags=re.IGNORECASE)
+        if not count:
             return
 
+        position = editor.textCursor().position()
         editor.blockSignals(True)
 
-        replace_cursor = QTextCursor(document)
+        replace_cursor = QTextCursor(editor.document())
         replace_cursor.beginEditBlock()
-
-        for start, end in reversed(locations):
-            replace_cursor.setPosition(start)
-            replace_cursor.setPosition(end, QTextCursor.KeepAnchor)
-            replace_cursor.insertText(replace_text)
-
+        replace_cursor.select(QTextCursor.Document)
+        replace_cursor.insertText(new_text)
         replace_cursor.endEditBlock()
+
+        replace_cursor.setPosition(min(position, editor.document().characterCount() - 1))
+        editor.setTextCursor(replace_cursor)
         editor.blockSignals(False)
 
         current_tab = self.parent().tabs.currentWidget()
         if current_tab:
             current_tab.mark_modified()
+            current_tab.update_timer.start()
 
         self.find_all_matches(search_text)
 
@@ -817,6 +1420,40 @@ class SearchPanel(QDockWidget):
         self.match_count_label.setText("No matches")
 
 
+class SettingsWriter(QObject):
+    """
+    Writes settings from a background thread so that INI/registry I/O never blocks
+    the UI. Move it to a QThread, then emit write_requested for each change and
+    sync_requested before the thread is stopped.
+    """
+    write_requested = pyqtSignal(str, object)
+    sync_requested = pyqtSignal()
+
+    def __init__(self, organization, application):
+        super().__init__()
+        self._organization = organization
+        self._application = application
+        self._settings = None
+        self.write_requested.connect(self._write)
+        # Blocking, so that sync_requested.emit() returns only after every queued write is on disk.
+        self.sync_requested.connect(self._sync, Qt.BlockingQueuedConnection)
+
+    def _backend(self):
+        """Creates the QSettings object lazily, so it belongs to the writer thread."""
+        if self._settings is None:
+            self._settings = QSettings(self._organization, self._application)
+        return self._settings
+
+    # Real slots (not plain methods) so that Qt delivers them on the writer's thread.
+    @pyqtSlot(str, object)
+    def _write(self, key, value):
+        self._backend().setValue(key, value)
+
+    @pyqtSlot()
+    def _sync(self):
+        self._backend().sync()
+
+
 class MainWindow(QMainWindow):
     """
     The main application window for the JSON Viewer & Editor IDE.
@@ -832,25 +1469,67 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         self.tabs.setTabsClosable(True)
         self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(lambda index: self._apply_theme_to_tab(self.tabs.widget(index)))
         self.setCentralWidget(self.tabs)
 
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
 
         self.settings = QSettings("TechJosha-Jones", "JSON Wombat")
-        self.load_settings()
+        # Every key is read once up front; later reads and unchanged writes skip the backend.
+        self._settings_cache = self._read_settings()
+        # Qt's own file dialog opens much faster than the native one on some platforms.
+        self.native_dialogs = self._settings_cache.get("native_dialogs", False)
+        # Destroying a running QThread aborts the process, so the thread belongs to the
+        # application rather than the window, and is stopped when the window closes or,
+        # if it never does, when the application quits or the interpreter exits.
+        app = QApplication.instance()
+        self._settings_thread = QThread(app)
+        self._settings_writer = SettingsWriter("TechJosha-Jones", "JSON Wombat")
+        self._settings_writer.moveToThread(self._settings_thread)
+        self._settings_thread.start()
+        app.aboutToQuit.connect(self._stop_settings_writer)
+        stop_thread = functools.partial(self._stop_writer_thread, self._settings_thread, self._settings_writer)
+        app.aboutToQuit.connect(stop_thread)
+        atexit.register(stop_thread)
+        # Settings changed during the session are written once things go quiet,
+        # rather than on every open, close or theme switch.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self.save_settings)
+        self.last_dir = os.path.expanduser("~")
+        # The last directory used for each kind of file, e.g. {"json": "/home/me/project"}.
+        self._recent_dirs = {}
+        # Open tabs in tab order, and keyed by filename, so loops and lookups over
+        # the tabs do not have to call self.tabs.widget(i) for each one.
+        self._tabs_list = []
+        self._open_by_path = {}
+        # Files being reopened from the last session, in tab order, and reads that have finished.
+        self._restore_queue = []
+        self._restored = {}
+        # Files that open_file is still reading on the thread pool.
+        self._pending_reads = set()
 
         self.search_panel = SearchPanel(self)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.search_panel)
+        # A burst of undo/redo steps (e.g. holding Ctrl+Z) refreshes the search once.
+        self._search_refresh_timer = QTimer(self)
+        self._search_refresh_timer.setSingleShot(True)
+        self._search_refresh_timer.timeout.connect(self._refresh_search)
 
         self.create_actions()
 
-        self.init_menu()
-        self.init_toolbar()
+        # Only the File menu is needed for the first paint; the rest follows right after.
+        self.init_menu_file()
+        QTimer.singleShot(0, self._init_rest)
 
-        self.set_theme(self.settings.value("theme", "dark"))
+        # The stored theme is already saved; applying it must not schedule a save.
+        self._apply_theme(self._settings_cache.get("theme", "dark"))
 
-        self.load_recent_files()
+        # Reading the rest of the settings and reopening files can wait until the
+        # window has been shown, so the first paint is not delayed by disk access.
+        QTimer.singleShot(0, self.load_settings)
+        QTimer.singleShot(0, self.load_recent_files)
 
     def create_actions(self):
         """Creates all QActions for menus and toolbars."""
@@ -899,69 +1578,146 @@ class MainWindow(QMainWindow):
         self.actions['minify'] = QAction("Minify JSON", self)
         self.actions['minify'].triggered.connect(self.minify_current_tab)
 
+        self.actions['native_dialogs'] = QAction("Use Native File Dialogs", self)
+        self.actions['native_dialogs'].setCheckable(True)
+        self.actions['native_dialogs'].setChecked(self.native_dialogs)
+        self.actions['native_dialogs'].toggled.connect(self.set_native_dialogs)
+
         self.actions['about'] = QAction("About", self)
         self.actions['about'].triggered.connect(self.show_about_dialog)
 
     def load_settings(self):
         """Loads application settings from QSettings."""
-        self.last_dir = os.path.expanduser("~")
-        if not os.path.isdir(self.settings.value("last_dir", "")):
-            self.last_dir = os.path.expanduser("~")
+        last_dir = self._settings_cache.get("last_dir", "")
+        if last_dir and os.path.isdir(last_dir):
+            self.last_dir = last_dir
         else:
-            self.last_dir = self.settings.value("last_dir", os.path.expanduser("~"))
+            self.last_dir = os.path.expanduser("~")
+        try:
+            recent_dirs = json.loads(self._settings_cache.get("recent_dirs") or "{}")
+        except (TypeError, ValueError):
+            recent_dirs = {}
+        if isinstance(recent_dirs, dict):
+            self._recent_dirs = {file_class: directory for file_class, directory in recent_dirs.items()
+                                 if isinstance(directory, str) and os.path.isdir(directory)}
+
+    def _read_settings(self):
+        """
+        Reads every stored setting once. The INI backend hands back booleans as
+        "true"/"false" and an empty list as None, so those values are converted to
+        the types save_settings stores, and unchanged values compare equal.
+        """
+        cache = {key: self.settings.value(key) for key in self.settings.allKeys()}
+        if "native_dialogs" in cache:
+            cache["native_dialogs"] = cache["native_dialogs"] in (True, "true")
+        if "open_files" in cache:
+            open_files = cache["open_files"]
+            if open_files is None:
+                cache["open_files"] = []
+            elif isinstance(open_files, str):
+                cache["open_files"] = [open_files]
+            else:
+                cache["open_files"] = list(open_files)
+        return cache
+
+    def _store_setting(self, key, value):
+        """
+        Queues a setting for the background writer, but only when it differs from
+        the cached value.
+        """
+        if self._settings_cache.get(key) != value:
+            self._settings_cache[key] = value
+            self._settings_writer.write_requested.emit(key, value)
 
     def save_settings(self):
         """Saves current application settings to QSettings."""
-        self.settings.setValue("theme", self.current_theme)
-        self.settings.setValue("last_dir", self.last_dir)
+        self._store_setting("theme", self.current_theme)
+        self._store_setting("last_dir", self.last_dir)
+        self._store_setting("recent_dirs", json.dumps(self._recent_dirs, sort_keys=True))
+        self._store_setting("native_dialogs", self.native_dialogs)
+
+        # While the last session is still being reopened only part of it is in the
+        # tabs, so keep the stored list until the restore has finished.
+        if not self._restore_queue:
+            open_files = existing_paths([tab.filename for tab in self._tabs_list if tab.filename])
+            self._store_setting("open_files", open_files)
 
-        open_files = []
-        for i in range(self.tabs.count()):
-            tab = self.tabs.widget(i)
-            if tab.filename and os.path.exists(
-                    tab.filename):
-                open_files.append(tab.filename)
-        self.settings.setValue("open_files", open_files)
+    def schedule_save_settings(self):
+        """Saves the settings after two seconds without further changes."""
+        self._save_timer.start(2000)
 
     def closeEvent(self, event):
         """
         Handles the application close event. Prompts to save unsaved changes
         and saves application settings.
         """
-        for i in range(self.tabs.count() - 1, -1, -1):
-            tab = self.tabs.widget(i)
-            if tab.modified:
-                reply = QMessageBox.question(
-                    self, "Save Changes?",
-                    f"The file '{os.path.basename(tab.filename) if tab.filename else 'Untitled'}' has unsaved changes. Save before closing?",
-                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-                )
-                if reply == QMessageBox.Yes:
-                    if not tab.save():
-                        event.ignore()
-                        return
-                elif reply == QMessageBox.Cancel:
-                    event.ignore()
-                    return
-            self.tabs.removeTab(i)
-
+        if not self._confirm_save_all([tab for tab in self._tabs_list if tab.modified]):
+            event.ignore()
+            return
+        # Settings first, while the tabs (and so the open file names) are still there.
+        self._save_timer.stop()
         self.save_settings()
-        event.accept()
 
-    def load_recent_files(self):
-        """Loads previously open files from settings and opens them."""
-        open_files = self.settings.value("open_files", [])
-        if open_files:
-            for fname in open_files:
-                if os.path.exists(fname):
-                    self.open_file(fname)
+        self._tabs_list.clear()
+        self._open_by_path.clear()
+        with QSignalBlocker(self.tabs):
+            self.tabs.clear()
+        self._stop_settings_writer()
+        event.accept()
 
-    def init_menu(self):
-        """Initializes the application's menu bar using common actions."""
-        menubar = self.menuBar()
+    def _stop_settings_writer(self):
+        """
+        Saves any pending settings, waits for every queued write to reach the disk
+        and stops the writer thread. Does nothing once the thread has stopped.
+        """
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.save_settings()
+        self._stop_writer_thread(self._settings_thread, self._settings_writer)
+
+    @staticmethod
+    def _stop_writer_thread(thread, writer):
+        """Flushes writer and stops thread, if it is still running."""
+        if thread.isRunning():
+            writer.sync_requested.emit()
+            thread.quit()
+            thread.wait()
 
-        # File Menu
-        file_menu = menubar.addMenu("File")
+    def load_recent_files(self):
+        """
+        Loads previously open files from settings and opens them. The files are
+        read concurrently on the thread pool; tabs are added in their saved order
+        as the reads complete.
+        """
+        open_files = self._settings_cache.get("open_files", [])
+        self._restore_queue = [fname for fname in dict.fromkeys(existing_paths(open_files))
+                               if fname not in self._open_by_path]
+        self._restored = {}
+        for fname in self._restore_queue:
+            job = FileReadJob(fname)
+            job.signals.finished.connect(self._on_restored_file_read)
+            QThreadPool.globalInstance().start(job)
+
+    def _on_restored_file_read(self, fname, content, error):
+        """Attaches every restored file whose read has finished and whose turn it is."""
+        self._restored[fname] = (content, error)
+        attached = False
+        # Tabs added in one go report a single change of current tab, for the last of them.
+        with QSignalBlocker(self.tabs):
+            while self._restore_queue and self._restore_queue[0] in self._restored:
+                fname = self._restore_queue.pop(0)
+                content, error = self._restored.pop(fname)
+                if error is not None:
+                    self._show_open_error(fname, error)
+                elif fname not in self._open_by_path:
+                    self._attach_tab(fname, content)
+                    attached = True
+        if attached:
+            self.tabs.currentChanged.emit(self.tabs.currentIndex())
+
+    def init_menu_file(self):
+        """Initializes the File menu, the first in the menu bar."""
+        file_menu = self.menuBar().addMenu("File")
         file_menu.addAction(self.actions['new'])
         file_menu.addAction(self.actions['open'])
         file_menu.addSeparator()
@@ -971,6 +1727,15 @@ class MainWindow(QMainWindow):
         file_menu.addAction(self.actions['close_tab'])
         file_menu.addAction(self.actions['exit'])
 
+    def _init_rest(self):
+        """Builds the menus and toolbar that are not needed for the first paint."""
+        self.init_menu()
+        self.init_toolbar()
+
+    def init_menu(self):
+        """Initializes the rest of the application's menu bar using common actions."""
+        menubar = self.menuBar()
+
         # Edit Menu
         edit_menu = menubar.addMenu("Edit")
         edit_menu.addAction(self.actions['undo'])
@@ -987,10 +1752,11 @@ class MainWindow(QMainWindow):
 
         light_action = QAction("Light", self)
         dark_action = QAction("Dark", self)
-        light_action.triggered.connect(lambda: self.set_theme("light"))
-        dark_action.triggered.connect(lambda: self.set_theme("dark"))
+        light_action.triggered.connect(functools.partial(self.set_theme, "light"))
+        dark_action.triggered.connect(functools.partial(self.set_theme, "dark"))
         theme_menu.addAction(light_action)
         theme_menu.addAction(dark_action)
+        view_menu.addAction(self.actions['native_dialogs'])
 
         # Help Menu
         help_menu = menubar.addMenu("Help")
@@ -1015,110 +1781,178 @@ class MainWindow(QMainWindow):
         current_tab = self.tabs.currentWidget()
         if current_tab and hasattr(current_tab, 'editor'):
             current_tab.editor.undo()
-            if self.search_panel.search_box.text():
-                self.search_panel.find_all_matches(self.search_panel.search_box.text())
-            else:
-                self.search_panel.clear_highlights()
+            self._search_refresh_timer.start(100)
 
     def perform_redo(self):
         """Performs redo action on the current editor, and refreshes highlights."""
         current_tab = self.tabs.currentWidget()
         if current_tab and hasattr(current_tab, 'editor'):
             current_tab.editor.redo()
-            if self.search_panel.search_box.text():
-                self.search_panel.find_all_matches(self.search_panel.search_box.text())
-            else:
-                self.search_panel.clear_highlights()
+            self._search_refresh_timer.start(100)
+
+    def _refresh_search(self):
+        """Re-runs the current search after a burst of undo/redo steps has settled."""
+        if self.search_panel.search_box.text():
+            self.search_panel.find_all_matches(self.search_panel.search_box.text())
+        else:
+            self.search_panel.clear_highlights()
+
+    # Palettes are built on first use (they need a QApplication) and shared by all windows.
+    _palettes = {}
+
+    @classmethod
+    def _palette(cls, mode):
+        """Returns the application palette for the light or dark theme."""
+        palette = cls._palettes.get(mode)
+        if palette is None:
+            palette = QApplication.style().standardPalette()
+            if mode == "dark":
+                palette.setColor(QPalette.Window, QColor(53, 53, 53))
+                palette.setColor(QPalette.WindowText, Qt.white)
+                palette.setColor(QPalette.Base, QColor(25, 25, 25))
+                palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
+                palette.setColor(QPalette.ToolTipBase, Qt.white)
+                palette.setColor(QPalette.ToolTipText, Qt.white)
+                palette.setColor(QPalette.Text, Qt.white)
+                palette.setColor(QPalette.Button, QColor(53, 53, 53))
+                palette.setColor(QPalette.ButtonText, Qt.white)
+                palette.setColor(QPalette.BrightText, Qt.red)
+                palette.setColor(QPalette.Link, QColor(42, 130, 218))
+                palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
+                palette.setColor(QPalette.HighlightedText, Qt.black)
+            cls._palettes[mode] = palette
+        return palette
 
     def set_theme(self, mode):
         """
         Sets the application-wide theme (light or dark).
-        Applies theme to all existing tabs' highlighters.
+        Only the current tab is rehighlighted straight away; other tabs pick up
+        the theme when they are next shown.
         """
+        self._apply_theme(mode)
+        self.schedule_save_settings()
+
+    def _apply_theme(self, mode):
+        """Applies the theme without touching the stored settings."""
         self.current_theme = mode
-        if mode == "dark":
-            QApplication.setStyle(QStyleFactory.create("Fusion"))
-            dark_palette = QApplication.palette()
-            dark_palette.setColor(QPalette.Window, QColor(53, 53, 53))
-            dark_palette.setColor(QPalette.WindowText, Qt.white)
-            dark_palette.setColor(QPalette.Base, QColor(25, 25, 25))
-            dark_palette.setColor(QPalette.AlternateBase, QColor(53, 53, 53))
-            dark_palette.setColor(QPalette.ToolTipBase, Qt.white)
-            dark_palette.setColor(QPalette.ToolTipText, Qt.white)
-            dark_palette.setColor(QPalette.Text, Qt.white)
-            dark_palette.setColor(QPalette.Button, QColor(53, 53, 53))
-            dark_palette.setColor(QPalette.ButtonText, Qt.white)
-            dark_palette.setColor(QPalette.BrightText, Qt.red)
-            dark_palette.setColor(QPalette.Link, QColor(42, 130, 218))
-            dark_palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
-            dark_palette.setColor(QPalette.HighlightedText, Qt.black)
-            QApplication.setPalette(dark_palette)
-        else:
+        if QApplication.style().objectName() != "fusion":
             QApplication.setStyle(QStyleFactory.create("Fusion"))
-            QApplication.setPalette(QApplication.style().standardPalette())
-
-        for i in range(self.tabs.count()):
-            tab_widget = self.tabs.widget(i)
-            if hasattr(tab_widget, 'highlighter'):
-                tab_widget.editor.blockSignals(True)
-                tab_widget.highlighter.set_theme(mode)
-                tab_widget.editor.blockSignals(False)
+        QApplication.setPalette(self._palette(mode))
+
+        self._apply_theme_to_tab(self.tabs.currentWidget())
         self.search_panel.set_highlight_colors(mode)
 
+    def _apply_theme_to_tab(self, tab):
+        """Rehighlights a tab in the current theme, if it is not already using it."""
+        if tab is not None and tab.highlighter.theme != self.current_theme:
+            with QSignalBlocker(tab.editor):
+                tab.highlighter.set_theme(self.current_theme)
+
+    def _register_tab(self, tab):
+        """Connects a newly created tab to the window and indexes it by filename."""
+        self._tabs_list.append(tab)
+        tab.dialog_options = self.dialog_options()
+        tab.editor.verticalScrollBar().valueChanged.connect(self.search_panel.schedule_highlight_refresh)
+        tab.filename_changed.connect(lambda previous, tab=tab: self._on_tab_filename_changed(tab, previous))
+        if tab.filename:
+            self._open_by_path[tab.filename] = tab
+
+    def _on_tab_filename_changed(self, tab, previous):
+        """Re-keys a tab in the filename index after Save As."""
+        if self._open_by_path.get(previous) is tab:
+            del self._open_by_path[previous]
+        if tab.filename:
+            self._open_by_path[tab.filename] = tab
+
+    def _unregister_tab(self, tab):
+        """Drops a closed tab from the tab list and filename index."""
+        self._tabs_list.remove(tab)
+        if tab.filename and self._open_by_path.get(tab.filename) is tab:
+            del self._open_by_path[tab.filename]
+
+    def dialog_options(self):
+        """Returns the QFileDialog options matching the native dialogs setting."""
+        return QFileDialog.Options() if self.native_dialogs else QFileDialog.DontUseNativeDialog
+
+    def set_native_dialogs(self, enabled):
+        """Switches between the platform's file dialogs and Qt's own."""
+        self.native_dialogs = enabled
+        for tab in self._tabs_list:
+            tab.dialog_options = self.dialog_options()
+        self.schedule_save_settings()
+
     def new_tab(self):
         """Creates and opens a new, empty JSON tab."""
-        tab = JsonTab()
-        self.tabs.addTab(tab, "Untitled")
+        tab = JsonTab(tab_widget=self.tabs, theme=self.current_theme)
+        self._register_tab(tab)
+        self.tabs.addTab(tab, tab.basename)
         self.tabs.setCurrentWidget(tab)
-        if hasattr(tab, 'highlighter'):
-            tab.editor.blockSignals(True)
-            tab.highlighter.rehighlight()
-            tab.editor.blockSignals(False)
 
     def open_file(self, fname=None):
         """
         Opens a JSON file in a new tab.
         If fname is None, a file dialog is shown.
         """
+        file_class = "json"
         if not fname:
-            fname, _ = QFileDialog.getOpenFileName(self, "Open JSON", self.last_dir, "JSON Files (*.json)")
+            start_dir = self._recent_dirs.get(file_class, self.last_dir)
+            fname, _ = QFileDialog.getOpenFileName(self, "Open JSON", start_dir, "JSON Files (*.json)",
+                                                   options=self.dialog_options())
         if fname:
             self.last_dir = os.path.dirname(fname)
-            try:
-                for i in range(self.tabs.count()):
-                    tab = self.tabs.widget(i)
-                    if tab.filename == fname:
-                        self.tabs.setCurrentWidget(tab)
-                        self.status_bar.showMessage(f"File '{os.path.basename(fname)}' is already open.", 3000)
-                        return
-
-                with open(fname, 'r') as f:
-                    content = f.read()
-                    tab = JsonTab(fname, content)
-                    self.tabs.addTab(tab, os.path.basename(fname))
-                    self.tabs.setCurrentWidget(tab)
-                    if hasattr(tab, 'highlighter'):
-                        tab.editor.blockSignals(True)
-                        tab.highlighter.rehighlight()
-                        tab.editor.blockSignals(False)
-                    self.status_bar.showMessage(f"Opened '{os.path.basename(fname)}'.", 3000)
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Could not open file: {e}")
-                self.status_bar.showMessage(f"Error opening '{os.path.basename(fname)}'.", 3000)
+            self.schedule_save_settings()
+            if self._focus_open_file(fname) or fname in self._pending_reads:
+                return
+            self._pending_reads.add(fname)
+            job = FileReadJob(fname)
+            job.signals.finished.connect(
+                lambda fname, content, error: self._on_file_read(fname, content, error, file_class))
+            QThreadPool.globalInstance().start(job)
+
+    def _focus_open_file(self, fname):
+        """Switches to the tab already showing fname, if there is one."""
+        existing = self._open_by_path.get(fname)
+        if existing is None:
+            return False
+        self.tabs.setCurrentWidget(existing)
+        self.status_bar.showMessage(f"File '{existing.basename}' is already open.", 3000)
+        return True
+
+    def _on_file_read(self, fname, content, error, file_class):
+        """Opens a tab for a file read by open_file, once the read has finished."""
+        self._pending_reads.discard(fname)
+        if error is not None:
+            self._show_open_error(fname, error)
+        elif not self._focus_open_file(fname):
+            self._recent_dirs[file_class] = os.path.dirname(fname)
+            self._attach_tab(fname, content)
+
+    def _attach_tab(self, fname, content):
+        """Adds a tab showing content that has already been read from fname."""
+        tab = JsonTab(fname, content, self.tabs, self.current_theme)
+        self._register_tab(tab)
+        self.tabs.addTab(tab, tab.basename)
+        self.tabs.setCurrentWidget(tab)
+        self.status_bar.showMessage(f"Opened '{tab.basename}'.", 3000)
+
+    def _show_open_error(self, fname, error):
+        """Reports a file that could not be opened."""
+        QMessageBox.critical(self, "Error", f"Could not open file: {error}")
+        self.status_bar.showMessage(f"Error opening '{os.path.basename(fname)}'.", 3000)
 
     def save_current_tab(self):
         """Saves the content of the currently active tab."""
         current = self.tabs.currentWidget()
         if current:
             if current.save():
-                self.status_bar.showMessage(f"File '{os.path.basename(current.filename)}' saved successfully.", 3000)
+                self.status_bar.showMessage(f"File '{current.basename}' saved successfully.", 3000)
 
     def save_as_current_tab(self):
         """Saves the content of the currently active tab to a new file."""
         current = self.tabs.currentWidget()
         if current:
             if current.save_as():
-                self.status_bar.showMessage(f"File '{os.path.basename(current.filename)}' saved successfully.", 3000)
+                self.status_bar.showMessage(f"File '{current.basename}' saved successfully.", 3000)
 
     def pretty_print_current_tab(self):
         """Pretty prints the JSON in the current tab."""
@@ -1132,35 +1966,83 @@ class MainWindow(QMainWindow):
         if current:
             current.minify()
 
+    def _confirm_save(self, tab):
+        """
+        Asks whether to save a modified tab before it is closed. Returns True if
+        the tab can be closed, or False if the user cancelled or saving failed.
+        """
+        if not tab.modified:
+            return True
+        reply = QMessageBox.question(
+            self, "Save Changes?",
+            f"The file '{tab.basename}' has unsaved changes. Save before closing?",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+        )
+        if reply == QMessageBox.Yes:
+            return tab.save()
+        return reply != QMessageBox.Cancel
+
+    def _confirm_save_all(self, tabs):
+        """
+        Asks once whether to save all of the given modified tabs. Returns True if
+        they can be closed, or False if the user cancelled or a save failed. Save All
+        only asks for a filename for tabs that were never saved, then writes every
+        tab without further prompts and reports all failures together.
+        """
+        if len(tabs) <= 1:
+            return all(self._confirm_save(tab) for tab in tabs)
+        names = "\n".join(tab.basename for tab in tabs)
+        reply = QMessageBox.question(
+            self, "Save Changes?",
+            f"These {len(tabs)} files have unsaved changes:\n\n{names}\n\nSave them before closing?",
+            QMessageBox.SaveAll | QMessageBox.Discard | QMessageBox.Cancel
+        )
+        if reply == QMessageBox.SaveAll:
+            # Ask for all the names first, so cancelling one of them writes nothing.
+            filenames = {}
+            for tab in tabs:
+                if not tab.filename:
+                    filenames[tab] = tab.ask_filename()
+                    if not filenames[tab]:
+                        return False
+            for tab, filename in filenames.items():
+                tab.filename = filename
+            errors = [(tab, tab.save_without_prompts()) for tab in tabs]
+            failures = "\n".join(f"{tab.basename}: {error}" for tab, error in errors if error is not None)
+            if failures:
+                QMessageBox.warning(
+                    self, "Save Failed",
+                    f"These files could not be saved, so the window was not closed:\n\n{failures}"
+                )
+                return False
+            return True
+        return reply == QMessageBox.Discard
+
     def close_tab(self, index):
         """
         Closes a tab at the given index, prompting to save if modified.
         """
         tab = self.tabs.widget(index)
-        if not tab:
+        if not tab or not self._confirm_save(tab):
             return
-        if tab.modified:
-            reply = QMessageBox.question(
-                self, "Save Changes?",
-                f"The file '{os.path.basename(tab.filename) if tab.filename else 'Untitled'}' has unsaved changes. Save before closing?",
-                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-            )
-            if reply == QMessageBox.Yes:
-                if not tab.save():
-                    return
-            elif reply == QMessageBox.Cancel:
-                return
+        self._unregister_tab(tab)
         self.tabs.removeTab(index)
+        self.schedule_save_settings()
 
     def show_about_dialog(self):
         """Displays the 'About' dialog."""
         msg = QMessageBox(self)
         msg.setWindowTitle("About JSON Wombat")
         msg.setTextFormat(Qt.RichText)
-        logo_pixmap = QPixmap("icons/json_logo.png")
-        if not logo_pixmap.isNull():
-            desired_size = QSize(64, 64)
-            scaled_pixmap = logo_pixmap.scaled(desired_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        # The scaled logo is cached, so the PNG is only decoded and scaled once.
+        scaled_pixmap = QPixmapCache.find("about_logo_64")
+        if scaled_pixmap is None:
+            logo_pixmap = QPixmap("icons/json_logo.png")
+            if not logo_pixmap.isNull():
+                desired_size = QSize(64, 64)
+                scaled_pixmap = logo_pixmap.scaled(desired_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                QPixmapCache.insert("about_logo_64", scaled_pixmap)
+        if scaled_pixmap is not None:
             msg.setIconPixmap(scaled_pixmap)
         else:
             print("Error: Logo Fail")
@@ -0,0 +1,348 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtCore import QSettings
+from PyQt5.QtGui import QTextCursor, QTextDocument
+from PyQt5.QtWidgets import QApplication, QMessageBox, QPlainTextEdit
+
+import main
+
+app = QApplication.instance() or QApplication([])
+
+BACKENDS = ["orjson", "stdlib"] if main.orjson is not None else ["stdlib"]
+
+
+def backend(name):
+    """Runs the code under the with block with orjson hidden for the stdlib backend."""
+    return mock.patch.object(main, "orjson", main.orjson if name == "orjson" else None)
+
+
+class LoadDumpJsonTest(unittest.TestCase):
+
+    def test_integer_boundaries_round_trip(self):
+        for name in BACKENDS:
+            for number in (-9223372036854775809, -9223372036854775808,
+                           18446744073709551615, 18446744073709551616):
+                with self.subTest(backend=name, number=number), backend(name):
+                    data = main.load_json(f'{{"n": {number}}}')
+                    self.assertEqual(data, {"n": number})
+                    self.assertIsInstance(data["n"], int)
+                    self.assertEqual(main.dump_json(data), f'{{"n":{number}}}')
+
+    def test_nan_infinity_and_out_of_range_floats_are_rejected(self):
+        for name in BACKENDS:
+            for text in ("NaN", "[Infinity]", '{"a": -Infinity}', "1e400", "[1234567890123456789, -1e400]"):
+                with self.subTest(backend=name, text=text), backend(name):
+                    with self.assertRaises(json.JSONDecodeError):
+                        main.load_json(text)
+
+    def test_pretty_output_matches(self):
+        data = {"a": [1, 2.5, "x"], "b": {}}
+        outputs = set()
+        for name in BACKENDS:
+            with backend(name):
+                outputs.add(main.dump_json(data, pretty=True))
+        self.assertEqual(outputs, {'{\n  "a": [\n    1,\n    2.5,\n    "x"\n  ],\n  "b": {}\n}'})
+
+
+class FindRangesTest(unittest.TestCase):
+
+    def test_matches_qtextdocument_find_with_astral_characters(self):
+        text = '{"\U0001F600ab": "AB\U0001F600aB", "k": "\U00010348ab"}'
+        document = QTextDocument(text)
+        expected = []
+        cursor = document.find("ab")
+        while not cursor.isNull():
+            expected.append((cursor.selectionStart(), cursor.selectionEnd()))
+            cursor = document.find("ab", cursor)
+
+        self.assertEqual(main.find_ranges(text, "ab"), expected)
+        self.assertEqual(len(expected), 4)
+
+    def test_ascii_text(self):
+        self.assertEqual(main.find_ranges("aXa xa", "xa"), [(1, 3), (4, 6)])
+
+
+class ExistingPathsTest(unittest.TestCase):
+
+    def test_keeps_existing_paths_in_order(self):
+        with tempfile.TemporaryDirectory() as directory:
+            first = os.path.join(directory, "b.json")
+            second = os.path.join(directory, "a.json")
+            for path in (first, second):
+                open(path, "w").close()
+            missing = os.path.join(directory, "missing.json")
+            missing_dir = os.path.join(directory, "nowhere", "c.json")
+
+            self.assertEqual(main.existing_paths([first, missing, missing_dir, second]), [first, second])
+
+    def test_falls_back_to_exists_when_listing_misses(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "a.json")
+            open(path, "w").close()
+            with mock.patch.object(main.os, "listdir", side_effect=PermissionError):
+                self.assertEqual(main.existing_paths([path]), [path])
+
+
+class ReplaceTextTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tab = main.JsonTab()
+
+    def tearDown(self):
+        self.tab.deleteLater()
+
+    def set_text(self, text):
+        self.tab.editor.setPlainText(text)
+        self.tab.editor.document().clearUndoRedoStacks()
+
+    def test_changed_lines_are_edited_in_place(self):
+        old_lines = [f'  "k{i}": "\U0001F600{i}",\n' for i in range(20)]
+        new_lines = list(old_lines)
+        new_lines[3] = '  "k3": "\U0001F4A9changed",\n'
+        new_lines[15] = '  "k15": "\U00010348",\n'
+        old_text = "{\n" + "".join(old_lines) + "}"
+        new_text = "{\n" + "".join(new_lines) + "}"
+        self.set_text(old_text)
+
+        with mock.patch.object(self.tab.editor, "setPlainText") as set_plain_text:
+            self.tab._replace_text(new_text)
+        set_plain_text.assert_not_called()
+        self.assertEqual(self.tab.editor.toPlainText(), new_text)
+
+        # All of it is undone in one step.
+        self.tab.editor.document().undo()
+        self.assertEqual(self.tab.editor.toPlainText(), old_text)
+
+    def test_mostly_changed_text_is_replaced_whole(self):
+        old_text = "\n".join(f'"\U0001F600{i}"' for i in range(10))
+        new_text = "\n".join(f'"\U0001F4A9{i}"' for i in range(10))
+        self.set_text(old_text)
+
+        with mock.patch.object(self.tab.editor, "setPlainText",
+                               wraps=self.tab.editor.setPlainText) as set_plain_text:
+            self.tab._replace_text(new_text)
+        set_plain_text.assert_called_once_with(new_text)
+        self.assertEqual(self.tab.editor.toPlainText(), new_text)
+
+    def test_does_not_mark_the_tab_modified(self):
+        self.set_text('{"a": 1}')
+        self.tab.modified = False
+        self.tab._replace_text('{"a": 2}')
+        self.assertFalse(self.tab.modified)
+
+
+
+class CountingHighlighter(main.JsonHighlighter):
+    """Counts the blocks highlighted and the formats applied."""
+
+    blocks = formats_set = 0
+
+    def highlightBlock(self, text):
+        self.blocks += 1
+        super().highlightBlock(text)
+
+    def setFormat(self, *args):
+        self.formats_set += 1
+        super().setFormat(*args)
+
+
+class HighlighterSizeLimitTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(main, "LARGE_DOCUMENT_CHARS", 1000)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.editor = QPlainTextEdit()
+        self.document = self.editor.document()
+        self.highlighter = CountingHighlighter(self.document)
+        self.reset_counts()
+
+    def tearDown(self):
+        self.editor.deleteLater()
+
+    def reset_counts(self):
+        self.highlighter.blocks = self.highlighter.formats_set = 0
+
+    def colored_blocks(self):
+        block = self.document.firstBlock()
+        count = 0
+        while block.isValid():
+            count += bool(block.layout().formats())
+            block = block.next()
+        return count
+
+    def test_pasting_a_large_document_highlights_nothing_and_visits_each_block_once(self):
+        QTextCursor(self.document).insertText("[1]\n" * 500)
+
+        self.assertEqual(self.highlighter.formats_set, 0)
+        self.assertEqual(self.highlighter.blocks, self.document.blockCount())
+        self.assertEqual(self.colored_blocks(), 0)
+
+    def test_crossing_the_limit_recolors_the_whole_document(self):
+        self.editor.setPlainText("[1]\n" * 200)
+        self.assertEqual(self.colored_blocks(), 200)
+
+        cursor = QTextCursor(self.document)
+        cursor.movePosition(QTextCursor.End)
+        cursor.insertText("x" * 1000)
+        self.assertEqual(self.colored_blocks(), 0)
+
+        cursor.movePosition(QTextCursor.Left, QTextCursor.KeepAnchor, 1000)
+        cursor.removeSelectedText()
+        self.assertEqual(self.colored_blocks(), 200)
+
+    def test_replacing_the_whole_document_is_highlighted_once(self):
+        self.editor.setPlainText("[1]\n" * 100)
+        self.reset_counts()
+        self.editor.setPlainText("[1]\n" * 500)
+
+        self.assertEqual(self.highlighter.formats_set, 0)
+        self.assertLessEqual(self.highlighter.blocks, self.document.blockCount() + 1)
+
+
+class AtomicSaveTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.target = os.path.join(self.directory.name, "data.json")
+        self.user_tmp = self.target + ".tmp"
+        with open(self.user_tmp, "w", encoding="utf-8") as f:
+            f.write("keep me")
+        self.tab = main.JsonTab(self.target)
+
+    def tearDown(self):
+        self.tab.deleteLater()
+        self.directory.cleanup()
+
+    def assert_only_user_files_left(self, *names):
+        self.assertEqual(sorted(os.listdir(self.directory.name)), sorted(names))
+        with open(self.user_tmp, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "keep me")
+
+    def test_new_file_is_written_with_default_permissions(self):
+        self.tab._write_file_atomically(b'{"a": 1}')
+
+        with open(self.target, "rb") as f:
+            self.assertEqual(f.read(), b'{"a": 1}')
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(os.stat(self.target).st_mode & 0o777, 0o666 & ~umask)
+        self.assert_only_user_files_left("data.json", "data.json.tmp")
+
+    def test_existing_file_keeps_its_permissions(self):
+        with open(self.target, "wb") as f:
+            f.write(b"{}")
+        os.chmod(self.target, 0o640)
+        self.tab._write_file_atomically(b"[]")
+
+        self.assertEqual(os.stat(self.target).st_mode & 0o777, 0o640)
+        self.assert_only_user_files_left("data.json", "data.json.tmp")
+
+    def test_failed_save_leaves_the_other_files_alone(self):
+        with mock.patch.object(main.os, "replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.tab._write_file_atomically(b"[]")
+
+        self.assert_only_user_files_left("data.json.tmp")
+
+
+def use_settings_directory(directory):
+    """Keeps MainWindow from reading or writing the user's real settings."""
+    for settings_format in (QSettings.NativeFormat, QSettings.IniFormat):
+        QSettings.setPath(settings_format, QSettings.UserScope, directory)
+
+
+class SettingsWriterShutdownTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        use_settings_directory(self.directory.name)
+        self.window = main.MainWindow()
+
+    def tearDown(self):
+        self.window.close()
+        self.directory.cleanup()
+
+    def test_quitting_without_closing_the_window_saves_and_stops_the_writer(self):
+        self.window.set_theme("light")
+        app.aboutToQuit.emit()
+
+        self.assertFalse(self.window._settings_thread.isRunning())
+        self.assertEqual(QSettings("TechJosha-Jones", "JSON Wombat").value("theme"), "light")
+
+    def test_stopping_twice_is_harmless(self):
+        self.window._stop_settings_writer()
+        self.window._stop_settings_writer()
+        self.assertFalse(self.window._settings_thread.isRunning())
+
+
+class SaveAllTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        use_settings_directory(self.directory.name)
+        self.window = main.MainWindow()
+        self.saved = os.path.join(self.directory.name, "saved.json")
+        with open(self.saved, "w", encoding="utf-8") as f:
+            f.write("{}")
+        self.tabs = [main.JsonTab(self.saved, "{}"), main.JsonTab()]
+        for tab in self.tabs:
+            tab.editor.setPlainText('{"changed": \U0001F600')
+            self.assertTrue(tab.modified)
+
+    def tearDown(self):
+        for tab in self.tabs:
+            tab.deleteLater()
+        self.window.close()
+        self.directory.cleanup()
+
+    def confirm_save_all(self, new_filename):
+        with mock.patch.object(QMessageBox, "question", return_value=QMessageBox.SaveAll), \
+                mock.patch.object(main.QFileDialog, "getSaveFileName", return_value=(new_filename, "")) as ask, \
+                mock.patch.object(QMessageBox, "warning") as warning, \
+                mock.patch.object(QMessageBox, "critical") as critical:
+            result = self.window._confirm_save_all(self.tabs)
+        critical.assert_not_called()
+        return result, ask, warning
+
+    def test_saves_every_tab_and_asks_a_name_only_for_untitled_ones(self):
+        new_file = os.path.join(self.directory.name, "new.json")
+        result, ask, warning = self.confirm_save_all(new_file)
+
+        self.assertTrue(result)
+        ask.assert_called_once()
+        warning.assert_not_called()
+        for path in (self.saved, new_file):
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), '{"changed": \U0001F600')
+        self.assertFalse(any(tab.modified for tab in self.tabs))
+
+    def test_cancelling_the_filename_saves_nothing(self):
+        result, ask, warning = self.confirm_save_all("")
+
+        self.assertFalse(result)
+        warning.assert_not_called()
+        with open(self.saved, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "{}")
+        self.assertTrue(all(tab.modified for tab in self.tabs))
+
+    def test_failures_are_reported_once_and_keep_the_window_open(self):
+        os.remove(self.saved)
+        os.mkdir(self.saved)
+        result, ask, warning = self.confirm_save_all(os.path.join(self.directory.name, "nowhere", "new.json"))
+
+        self.assertFalse(result)
+        warning.assert_called_once()
+        message = warning.call_args[0][2]
+        self.assertIn("saved.json", message)
+        self.assertIn("new.json", message)
+
+
+if __name__ == "__main__":
+    unittest.main()